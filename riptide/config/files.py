@@ -16,6 +16,7 @@ else:
 
 from appdirs import user_config_dir
 from contextlib import ExitStack
+from functools import lru_cache
 
 # Expected name of the project files during auto-discovery
 from typing import Optional
@@ -151,4 +152,22 @@ def remove_all_special_chars(string: str) -> str:
 
 def path_in_project(path: str, project: 'Project') -> bool:
     """Check if a path is within a project's directory or a subdirectory of it (symlinks are ignored)."""
-    return path.startswith(os.path.abspath(project.folder()) + os.sep)
+    folder = project.folder()
+    # Relative paths depend on the working directory, only absolute paths can be cached.
+    if not os.path.isabs(folder):
+        folder = os.path.abspath(folder)
+    if not os.path.isabs(path):
+        path = os.path.abspath(path)
+    return _path_in_folder(folder, path)
+
+
+@lru_cache(maxsize=4096)
+def _path_in_folder(folder: str, path: str) -> bool:
+    """
+    Check if the absolute path is within the absolute folder (but not folder itself).
+    Both paths are normalized, symlinks are ignored.
+    """
+    folder = os.path.normpath(folder)
+    if not folder.endswith(os.sep):
+        folder += os.sep
+    return os.path.normpath(path).startswith(folder)
@@ -1,14 +1,31 @@
+import errno
 import os
+import queue
 import shutil
+import stat
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Tuple, Dict, Union, List, Optional
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from functools import partial
+from typing import Tuple, Dict, Union, List, Optional, Callable
 
 from riptide.config.files import path_in_project
-from riptide.engine.results import StartStopResultStep, MultiResultQueue
+from riptide.engine.results import StartStopResultStep, MultiResultQueue, ResultQueue, ResultError
 
 
 RIPTIDE_HOST_HOSTNAME = "host.riptide.internal"  # the engine has to make the host reachable under this hostname
 
+# Time in seconds that addresses of services are cached for
+_ADDRESS_CACHE_TTL = 1.0
+# Time in seconds that the status of all services of a project is cached for
+_STATUS_CACHE_TTL = 0.25
+# Number of threads copying files concurrently in path_copy. Copying is bound by I/O latency, not by CPUs.
+_COPY_WORKERS = 8
+_COPY_FILE_RANGE_CHUNK_SIZE = 2 ** 30
+# copy_file_range fails with these if it can't be used for the files, the copy has to use a different method then.
+_COPY_FILE_RANGE_UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+
 
 class ExecError(BaseException):
     pass
@@ -18,6 +35,150 @@ class ServiceStoppedException(BaseException):
     pass
 
 
+def _copytree_fast(src: str, dst: str) -> None:
+    """
+    Recursively copy the directory src to dst, including metadata (see shutil.copystat).
+    dst may already exist. Symlinks are followed.
+
+    Uses os.scandir, so that the file type of most entries is known without an additional stat call.
+
+    Like shutil.copytree, errors copying single entries don't stop the copy, they are collected
+    and raised together after everything else was copied.
+
+    Copying many small files is bound by the latency of the system calls for each file, so
+    the directory tree is created first and then the files are copied concurrently.
+
+    :raises: shutil.Error: With a list of (src, dst, reason) tuples for all entries that could not be copied.
+    """
+    directories = []
+    files = []
+    errors = []
+    _copytree_fast_walk(src, dst, directories, files, errors)
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+            results = list(executor.map(_copyfile_with_stat, *zip(*files)))
+    else:
+        results = [_copyfile_with_stat(file, target) for file, target in files]
+    errors += [error for error in results if error is not None]
+    # Copying into the directories changes their times, so their metadata is copied last, deepest first.
+    for directory, target in reversed(directories):
+        try:
+            shutil.copystat(directory, target)
+        except OSError as why:
+            errors.append((directory, target, str(why)))
+    if errors:
+        raise shutil.Error(errors)
+
+
+def _copytree_fast_walk(src: str, dst: str,
+                        directories: List[Tuple[str, str]],
+                        files: List[Tuple[str, str]],
+                        errors: List[Tuple[str, str, str]]) -> None:
+    """Create the directory tree of src in dst and collect the directories and files to copy metadata of / copy."""
+    os.makedirs(dst, exist_ok=True)
+    directories.append((src, dst))
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                try:
+                    _copytree_fast_walk(entry.path, target, directories, files, errors)
+                except OSError as why:
+                    errors.append((entry.path, target, str(why)))
+            else:
+                files.append((entry.path, target))
+
+
+def _copyfile_with_stat(src: str, dst: str) -> Optional[Tuple[str, str, str]]:
+    """Copy the file src to dst, including metadata. Returns an error as (src, dst, reason) instead of raising it."""
+    try:
+        _fast_copyfile(src, dst)
+        shutil.copystat(src, dst)
+    except OSError as why:
+        return src, dst, str(why)
+    return None
+
+
+def _fast_copyfile(src: str, dst: str) -> None:
+    """
+    Copy the contents of the file src to dst, without copying the data through user space.
+
+    Uses os.copy_file_range where available (Linux), which lets the kernel (or the file system) copy
+    the data directly. Falls back to shutil.copyfile, which uses os.sendfile / fcopyfile where possible,
+    if copy_file_range isn't available or not supported for these files.
+    Files that are not regular files (eg. named pipes) are also passed to shutil.copyfile.
+
+    :raises: shutil.SameFileError: If src and dst are the same file.
+    :raises: shutil.SpecialFileError: If src or dst is a named pipe.
+    """
+    if not hasattr(os, 'copy_file_range') or not _copy_file_range(src, dst):
+        shutil.copyfile(src, dst)
+
+
+def _copy_file_range(src: str, dst: str) -> bool:
+    """
+    Copy the contents of the regular file src to dst using os.copy_file_range.
+    Returns False without copying, if src or dst is not a regular file or copy_file_range can't be used for them.
+    """
+    # Opened non-blocking, opening a named pipe would otherwise block until there is a writer / reader.
+    src_fd = os.open(src, os.O_RDONLY | os.O_CLOEXEC | os.O_NONBLOCK)
+    try:
+        src_stat = os.fstat(src_fd)
+        if not stat.S_ISREG(src_stat.st_mode):
+            return False
+        try:
+            # dst is not truncated on open, to not destroy src if they are the same file.
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC | os.O_NONBLOCK, 0o666)
+        except OSError as err:
+            # ENXIO: dst is a named pipe without a reader
+            if err.errno == errno.ENXIO:
+                return False
+            raise
+        try:
+            dst_stat = os.fstat(dst_fd)
+            if not stat.S_ISREG(dst_stat.st_mode):
+                return False
+            if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+                raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+            os.ftruncate(dst_fd, 0)
+            copied = 0
+            while True:
+                sent = os.copy_file_range(src_fd, dst_fd, _COPY_FILE_RANGE_CHUNK_SIZE)
+                if sent == 0:
+                    break
+                copied += sent
+            # Some file systems (eg. procfs, sysfs, some FUSE file systems) return 0 without copying anything.
+            return copied > 0 or src_stat.st_size == 0
+        except OSError as err:
+            if err.errno not in _COPY_FILE_RANGE_UNSUPPORTED_ERRNOS:
+                raise
+            return False
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+class _ServiceResultQueue(ResultQueue):
+    """
+    ResultQueue for a single service, that remembers whether it was ended with an error.
+    Calls before_end before the end of the queue can be read.
+    """
+    def __init__(self, before_end: Callable[[], None] = lambda: None):
+        super().__init__()
+        self.before_end = before_end
+        self.failed = False
+
+    def end(self):
+        self.before_end()
+        super().end()
+
+    def end_with_error(self, error: ResultError):
+        self.failed = True
+        self.before_end()
+        super().end_with_error(error)
+
+
 class AbstractEngine(ABC):
     @abstractmethod
     def start_project(self,
@@ -28,6 +189,11 @@ class AbstractEngine(ABC):
         """
         Starts all services in the project.
 
+        Independent services must be started concurrently, only services depending on each other
+        (see _service_dependencies) may be started one after another. The returned queue must report
+        the results of each service as soon as they are available.
+        Engines should implement _start_one_service and delegate to _start_services_parallel.
+
         All containers started for a project must be in the same isolated container network and service
         containers must be reachable by name as hostname. In addition the services started must also be added
         to the container networks of all projects within the 'links' list of the project.
@@ -53,54 +219,306 @@ class AbstractEngine(ABC):
         """
         Stops all services in the project
 
+        All services must be stopped concurrently.
+        Engines should implement _stop_one_service and delegate to _stop_services_parallel.
+
         :type project: 'Project'
         :param services: Names of the services to stop
         :return: MultiResultQueue[StopResult]
         """
         pass
 
-    @abstractmethod
+    def _service_dependencies(self, project: 'Project', service_name: str) -> List[str]:
+        """
+        Returns the names of the services that must be started before service_name can be started.
+        Services don't declare any dependencies by default, engines may override this.
+        """
+        return []
+
+    def _start_one_service(self,
+                           project: 'Project',
+                           service_name: str,
+                           result_queue: ResultQueue[StartStopResultStep],
+                           quick=False,
+                           command_group: str = "default") -> None:
+        """
+        Start a single service. Called by _start_services_parallel from a worker thread.
+        Must report the progress to result_queue and end it (on success or with an error).
+        Raised exceptions end the queue with an error.
+
+        See start_project for the parameters.
+        """
+        raise NotImplementedError("The engine does not support starting single services.")
+
+    def _stop_one_service(self,
+                          project: 'Project',
+                          service_name: str,
+                          result_queue: ResultQueue[StartStopResultStep]) -> None:
+        """
+        Stop a single service. Called by _stop_services_parallel from a worker thread.
+        Must report the progress to result_queue and end it (on success or with an error).
+        Raised exceptions end the queue with an error.
+
+        See stop_project for the parameters.
+        """
+        raise NotImplementedError("The engine does not support stopping single services.")
+
+    def _start_services_parallel(self,
+                                 project: 'Project',
+                                 services: List[str],
+                                 quick=False,
+                                 command_group: str = "default",
+                                 wait_for: Optional[Dict[str, Future]] = None) -> MultiResultQueue[StartStopResultStep]:
+        """
+        Start the services concurrently using _start_one_service, one worker per service.
+        A service is only started after all of its dependencies (within services) have been started
+        successfully. If a dependency fails, the service fails as well.
+
+        Steps that must not run concurrently (eg. creating the project network) must be
+        done by the engine before calling this.
+
+        Returns immediately, see start_project for the parameters and return value.
+
+        :param wait_for: Futures that must be done (successfully or not) before the service with the
+                         name of the key is started.
+        """
+        # The cached state of a service must be gone before readers of the queue see that it was started.
+        queues = {
+            service_name: _ServiceResultQueue(partial(self._invalidate_service_cache, project, service_name))
+            for service_name in services
+        }
+        futures: Dict[str, Future] = {}
+        wait_for = wait_for or {}
+
+        def start(service_name):
+            result_queue = queues[service_name]
+            dependencies = [dep for dep in self._service_dependencies(project, service_name) if dep in futures]
+            wait([futures[dep] for dep in dependencies] + ([wait_for[service_name]] if service_name in wait_for else []))
+            # Engines may end the queue with an error without raising, so the queue is checked, not the future.
+            if any(queues[dep].failed for dep in dependencies):
+                result_queue.end_with_error(ResultError(f"A service that {service_name} depends on failed to start."))
+                raise ResultError(f"Dependency of {service_name} failed.")
+            self._run_for_result_queue(result_queue, "Error starting the service.",
+                                       self._start_one_service, project, service_name, result_queue,
+                                       quick, command_group)
+
+        executor = ThreadPoolExecutor(max_workers=max(1, len(services)))
+        # Dependencies are submitted before their dependents, so their futures always exist when waited for.
+        for service_name in self._sort_by_dependencies(project, services):
+            futures[service_name] = executor.submit(start, service_name)
+        executor.shutdown(wait=False)
+        return MultiResultQueue({result_queue: service_name for service_name, result_queue in queues.items()})
+
+    def _pull_and_start_services_parallel(self,
+                                          project: 'Project',
+                                          services: List[str],
+                                          quick=False,
+                                          command_group: str = "default",
+                                          max_pull_workers=8) -> MultiResultQueue[StartStopResultStep]:
+        """
+        Pull the images of the services and start them, like _start_services_parallel. Each service is
+        started as soon as its image was pulled, instead of waiting for all pulls to finish first.
+        Every image is only pulled once, using _pull_image with at most max_pull_workers pulls at the
+        same time. Failed pulls are ignored, the image may still be available locally.
+
+        Engines may use this in start_project instead of _start_services_parallel.
+
+        Returns immediately, see start_project for the parameters and return value.
+        """
+        pulls: Dict[str, Future] = {}
+        pull_for_service: Dict[str, Future] = {}
+        executor = ThreadPoolExecutor(max_workers=max_pull_workers)
+        for service_name in services:
+            image = project["app"]["services"][service_name]["image"]
+            if image not in pulls:
+                pulls[image] = executor.submit(self._pull_image, image, lambda text: None)
+            pull_for_service[service_name] = pulls[image]
+        executor.shutdown(wait=False)
+        return self._start_services_parallel(project, services, quick, command_group, wait_for=pull_for_service)
+
+    def _stop_services_parallel(self, project: 'Project', services: List[str]) -> MultiResultQueue[StartStopResultStep]:
+        """
+        Stop the services concurrently using _stop_one_service, one worker per service.
+
+        Returns immediately, see stop_project for the parameters and return value.
+        """
+        # The cached state of a service must be gone before readers of the queue see that it was stopped.
+        queues = {
+            _ServiceResultQueue(partial(self._invalidate_service_cache, project, service_name)): service_name
+            for service_name in services
+        }
+        executor = ThreadPoolExecutor(max_workers=max(1, len(services)))
+        for result_queue, service_name in queues.items():
+            executor.submit(self._run_for_result_queue, result_queue, "Error stopping the service.",
+                            self._stop_one_service, project, service_name, result_queue)
+        executor.shutdown(wait=False)
+        return MultiResultQueue(queues)
+
+    def _sort_by_dependencies(self, project: 'Project', services: List[str]) -> List[str]:
+        """
+        Sorts services so that all dependencies (within services) of a service come before it.
+
+        :raises: ValueError: If the dependencies of the services contain a cycle.
+        """
+        result = []
+        visiting = set()
+
+        def visit(service_name):
+            if service_name in result:
+                return
+            if service_name in visiting:
+                raise ValueError(f"Services have cyclic dependencies, involving: {service_name}")
+            visiting.add(service_name)
+            for dependency in self._service_dependencies(project, service_name):
+                if dependency in services:
+                    visit(dependency)
+            visiting.remove(service_name)
+            result.append(service_name)
+
+        for name in services:
+            visit(name)
+        return result
+
+    @staticmethod
+    def _run_for_result_queue(result_queue: ResultQueue, error_message: str, func, *args) -> None:
+        """Run func with args. If it raises, end result_queue with an error and re-raise."""
+        try:
+            func(*args)
+        except Exception as ex:
+            if not result_queue.was_ended_put:
+                result_queue.end_with_error(ResultError(error_message, cause=ex))
+            raise
+
     def status(self, project: 'Project') -> Dict[str, bool]:
         """
         Returns the status for the given project (whether services are started or not)
 
+        The status of all services is queried at once using _list_project_containers and
+        cached for a short time.
+
         :param project: 'Project'
         :return: Dict[str, bool]
         """
-        pass
+        containers = self._project_containers(project)
+        services = project["app"]["services"] if "services" in project["app"] else {}
+        return {service_name: containers.get(service_name, False) for service_name in services}
 
-    @abstractmethod
     def service_status(self, project: 'Project', service_name: str) -> bool:
         """
         Returns the status for a single service in a given project (whether service is started or not)
 
+        Uses the same cached query as status.
+
         :param project: 'Project'
         :param service_name: str
         :return: bool
         """
-        pass
+        return self._project_containers(project).get(service_name, False)
+
+    def await_state(self, project: 'Project', service_name: str, state: bool, timeout: float) -> bool:
+        """
+        Waits until the service is started (state True) or stopped (state False).
+
+        The default implementation polls service_status. Engines that can subscribe to
+        state changes of containers (eg. Docker events) should override this and block on those instead.
+
+        :param project: 'Project'
+        :param service_name: str
+        :param state: Whether to wait for the service to be started or stopped.
+        :param timeout: Maximum time to wait in seconds.
+        :return: Whether the service reached the state before the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while self.service_status(project, service_name) != state:
+            if time.monotonic() >= deadline:
+                return False
+            # The status is cached, don't poll more often than it could change.
+            time.sleep(_STATUS_CACHE_TTL)
+        return True
+
+    def _list_project_containers(self, project: 'Project') -> Dict[str, bool]:
+        """
+        Returns the containers (or whatever is the equivalent) of all services of the project that exist,
+        as a dict that maps service names to whether the container is running.
+        Must be done with as few queries to the container backend as possible, ideally one.
+        """
+        raise NotImplementedError("The engine does not support listing the containers of a project.")
+
+    def _project_containers(self, project: 'Project') -> Dict[str, bool]:
+        """Cached version of _list_project_containers."""
+        cache = self._cache('_status_cache')
+        now = time.monotonic()
+        # Workers may invalidate entries concurrently, so the entry is only looked up once.
+        entry = cache.get(project["name"])
+        if entry is not None:
+            containers, cached_at = entry
+            if now - cached_at < _STATUS_CACHE_TTL:
+                return containers
+        containers = self._list_project_containers(project)
+        cache[project["name"]] = (containers, now)
+        return containers
 
-    @abstractmethod
     def container_name_for(self, project: 'Project', service_name: str) -> str:
         """
         Returns the container name for the given service or whatever is the equivalent.
 
+        The result is cached per project and service name.
+        Engines should implement _container_name_for_impl.
+
         :param project: 'Project'
         :param service_name: str
         :return: bool
         """
-        pass
+        cache = self._cache('_container_name_cache')
+        key = (project["name"], service_name)
+        if key not in cache:
+            cache[key] = self._container_name_for_impl(project, service_name)
+        return cache[key]
+
+    def _container_name_for_impl(self, project: 'Project', service_name: str) -> str:
+        """See container_name_for. The name must only depend on the project name and service name."""
+        raise NotImplementedError("The engine does not support container names.")
 
-    @abstractmethod
     def address_for(self, project: 'Project', service_name: str) -> Union[None, Tuple[str, int]]:
         """
         Returns the ip address and port of the host providing the service for project.
 
+        The result is cached per project and service name for a short time and invalidated
+        when the service is started or stopped using _start_services_parallel / _stop_services_parallel.
+        Engines should implement _address_for_impl.
+
         :param project: 'Project'
         :param service_name: str
         :return: Tuple[str, int]
         """
-        pass
+        cache = self._cache('_address_cache')
+        key = (project["name"], service_name)
+        now = time.monotonic()
+        # Workers may invalidate entries concurrently, so the entry is only looked up once.
+        entry = cache.get(key)
+        if entry is not None:
+            address, cached_at = entry
+            if now - cached_at < _ADDRESS_CACHE_TTL:
+                return address
+        address = self._address_for_impl(project, service_name)
+        cache[key] = (address, now)
+        return address
+
+    def _address_for_impl(self, project: 'Project', service_name: str) -> Union[None, Tuple[str, int]]:
+        """See address_for."""
+        raise NotImplementedError("The engine does not support service addresses.")
+
+    def _invalidate_service_cache(self, project: 'Project', service_name: str) -> None:
+        """Removes all cached information about the state of the service."""
+        self._cache('_address_cache').pop((project["name"], service_name), None)
+        self._cache('_status_cache').pop(project["name"], None)
+
+    def _cache(self, name: str) -> dict:
+        """
+        Returns the cache dict with the given name. Caches are created on first access, so that
+        engines don't need to call the constructor of AbstractEngine.
+        """
+        return self.__dict__.setdefault(name, {})
 
     @abstractmethod
     def cmd(self,
@@ -241,6 +659,10 @@ class AbstractEngine(ABC):
         """
         Pull new versions of images for commands and services described in project.
 
+        The images must be pulled concurrently, one pull per image, using a bounded pool of workers.
+        Implementations should implement _pull_image and delegate to _pull_images_parallel,
+        which takes care of running the pulls and merging their status reports into update_func.
+
         Not fining an image should NOT raise an error and instead print a warning as status report.
 
         :param project:     The project to pull all images for. Applies to all commands and services in project.
@@ -252,17 +674,79 @@ class AbstractEngine(ABC):
                             Calling it does NOT add new lines (\\n).
                             End result should be looking like this::
 
-                                [service/service1] Pulling 'image/name':
-                                    Status report... Can use carriage return here.
-                                [service/service2] Pulling 'image/name':
-                                    Status report... Can use carriage return here.
-                                [command/command1] Pulling 'image/name':
-                                    Warning: Image not found in repository.
+                                [service/service1] Pulling 'image/name'...
+                                [command/command1] Pulling 'image/name'...
+                                [service/service2] Pulling 'image/name'...
+                                [service/service2] Status report... Line is reset on every update.
+                                [command/command1] Warning: Image not found in repository.
+                                [service/service1] Done.
+                                [service/service2] Done.
 
                                 Done.
         """
         pass
 
+    def _pull_image(self, image: str, update_func: Callable[[str], None]) -> str:
+        """
+        Pull a single image. Called by _pull_images_parallel from a worker thread.
+
+        :param image:       Name of the image to pull.
+        :param update_func: Function to send intermediate status reports to (single line, no \\n).
+        :return:            Final status report for this image, eg. "Done." or a warning.
+                            Not finding the image must be reported as a warning, other errors must be raised.
+        """
+        raise NotImplementedError("The engine does not support pulling single images.")
+
+    def _pull_images_parallel(self,
+                              images: List[Tuple[str, str]],
+                              update_func: Callable[[str], None],
+                              line_reset='\n',
+                              max_workers=8) -> None:
+        """
+        Pull all images concurrently using _pull_image, with at most max_workers pulls at the same time.
+
+        Status reports of all pulls are collected in a queue and passed to update_func by a single
+        consumer thread, so that calls to update_func are never made concurrently. Each line is prefixed
+        with the label of the image. Intermediate reports reset the current line, final reports end it.
+
+        :param images:      List of (label, image name) tuples. Label is eg. "service/service1".
+        :param update_func: See pull_images.
+        :param line_reset:  See pull_images.
+        :param max_workers: Maximum number of concurrent pulls.
+        :raises:            The first error raised by _pull_image, after all pulls are finished.
+        """
+        messages = queue.Queue()
+
+        def consume():
+            # Whether the current line contains an intermediate report that must be reset first
+            line_dirty = False
+            while True:
+                message = messages.get()
+                if message is None:
+                    if line_dirty:
+                        update_func(line_reset)
+                    return
+                label, text, final = message
+                update_func(("" if not line_dirty else line_reset) + f"[{label}] {text}" + ("\n" if final else ""))
+                line_dirty = not final
+
+        def pull(label, image):
+            messages.put((label, f"Pulling '{image}'...", True))
+            messages.put((label, self._pull_image(image, lambda text: messages.put((label, text, False))), True))
+
+        consumer = threading.Thread(target=consume, daemon=True)
+        consumer.start()
+        futures = []
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(images)))) as executor:
+                futures = [executor.submit(pull, label, image) for label, image in images]
+        finally:
+            messages.put(None)
+            consumer.join()
+        # Raise errors of failed pulls, only after all other pulls are finished.
+        for future in futures:
+            future.result()
+
     def path_rm(self, path, project: 'Project'):
         """
         Delete a path. Default is using python builtin functions.
@@ -276,10 +760,14 @@ class AbstractEngine(ABC):
         """
         if not path_in_project(path, project):
             raise PermissionError(f"Tried to delete a file/directory that is not within the project: {path}")
-        if os.path.isfile(path):
-            os.remove(path)
-        else:
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            return
+        if stat.S_ISDIR(st.st_mode):
             shutil.rmtree(path)
+        else:
+            os.unlink(path)
 
     def path_copy(self, fromm, to, project: 'Project'):
         """
@@ -292,9 +780,12 @@ class AbstractEngine(ABC):
         if not path_in_project(to, project):
             raise PermissionError(f"Tried to copy into a path that is not within the project: {fromm} -> {to}")
         if os.path.isfile(fromm):
-            shutil.copy2(fromm, to)
+            if os.path.isdir(to):
+                to = os.path.join(to, os.path.basename(fromm))
+            _fast_copyfile(fromm, to)
+            shutil.copystat(fromm, to)
         else:
-            shutil.copytree(fromm, to, dirs_exist_ok=True)
+            _copytree_fast(fromm, to)
 
     @abstractmethod
     def performance_value_for_auto(self, key: str, platform: str) -> bool:
@@ -303,6 +794,12 @@ class AbstractEngine(ABC):
         should be activated for the provided platform, because they
         drastically increase performance.
 
+        Optimizations enabled by "auto" must not change the behaviour of projects. Optimizations that
+        would break guarantees of this interface must not be enabled, eg. running service containers in
+        the host network would break the isolated project network and reaching services by their name.
+
+        Must return False for keys the engine does not know.
+
         :param key: Optimization key, as found in the Config schema's "performance" entry.
         :param platform: windows/darwin/linux or something else (return value of platform.system() in lower case).
         """
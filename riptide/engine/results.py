@@ -1,8 +1,8 @@
 import asyncio
 import traceback
+from collections import deque
 
-import janus
-from typing import Dict, NamedTuple, Union, TypeVar, Generic
+from typing import Dict, NamedTuple, Union, TypeVar, Generic, Optional
 
 
 class StartStopResultStep(NamedTuple):
@@ -51,7 +51,7 @@ T = TypeVar('T')
 
 class ResultQueue(Generic[T]):
     """
-    Class implementing a basic message queue via a asyncio.Queue.
+    Class implementing a basic message queue for one writing thread and one reading coroutine.
 
     Writing:
         Synchronously (using a different thread/executor)
@@ -62,6 +62,9 @@ class ResultQueue(Generic[T]):
         Asynchronously (asyncio).
         Can be read by (async.) iterating over it or by using get().
 
+    Messages are stored in a deque, which doesn't need a lock for appending and popping.
+    The reader is only woken up via its event loop, if it is waiting for a message.
+
     All ResultQueues can be poisoned by calling poison(). After calling this
     class method reading and writing for all existing and future queues will cause
     an ResultPoisoned to be raised.
@@ -74,7 +77,9 @@ class ResultQueue(Generic[T]):
     poisoned = False
 
     def __init__(self):
-        self.queue = janus.Queue()
+        self.queue = deque()
+        # Future the reader is currently waiting on for new messages, if any
+        self._waiter: Optional[asyncio.Future] = None
         self.was_ended_put = False
         self.was_ended_get = False
         self.__class__.__opened_instances.append(self)
@@ -85,16 +90,32 @@ class ResultQueue(Generic[T]):
         if self.__class__.poisoned:
             raise ResultPoisoned("Process was interrupted.")
 
-        self.queue.sync_q.put(obj)
+        self._put(obj)
 
     def end(self):
         self.was_ended_put = True
-        self.queue.sync_q.put(EndResultQueue())
         self.__class__.__opened_instances.remove(self)
+        self._put(EndResultQueue())
 
     def end_with_error(self, error: ResultError):
         self.was_ended_put = True
-        self.queue.sync_q.put(error)
+        self._put(error)
+
+    def _put(self, obj):
+        self.queue.append(obj)
+        # If the reader registers a waiter after this, it will see the appended message before waiting.
+        waiter = self._waiter
+        if waiter is not None:
+            try:
+                waiter.get_loop().call_soon_threadsafe(self._wake_up, waiter)
+            except RuntimeError:
+                # The loop of the reader was closed since it registered the waiter, nobody is left to wake up.
+                pass
+
+    @staticmethod
+    def _wake_up(waiter: asyncio.Future):
+        if not waiter.done():
+            waiter.set_result(None)
 
     @classmethod
     def poison(cls):
@@ -114,7 +135,15 @@ class ResultQueue(Generic[T]):
             raise EOFError("ResultQueue was already ended.")
         if self.__class__.poisoned:
             raise ResultPoisoned("Process was interrupted.")
-        top = await self.queue.async_q.get()
+        while not self.queue:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                # Check again, the writer may have put a message before the waiter was registered.
+                if not self.queue:
+                    await self._waiter
+            finally:
+                self._waiter = None
+        top = self.queue.popleft()
         if isinstance(top, EndResultQueue):
             self.was_ended_get = True
             raise top
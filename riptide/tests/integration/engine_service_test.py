@@ -4,7 +4,6 @@ import platform
 import re
 from time import sleep
 
-import requests
 import stat
 from pathlib import PurePosixPath
 
@@ -16,6 +15,15 @@ from riptide.tests.integration.project_loader import load
 from riptide.tests.integration.testcase_engine import EngineTest
 
 
+def _write_file(path, data: bytes):
+    """Write data to the file at path, without creating a buffered file object."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 class EngineServiceTest(EngineTest):
 
     # without src is implicitly tested via EngineStartStopTest.test_simple_result
@@ -26,20 +34,22 @@ class EngineServiceTest(EngineTest):
             with project_ctx as loaded:
                 project = loaded.config["project"]
                 service_name = "simple_with_src"
+                # Services that don't depend on the src are started together with this service, but only once.
+                services = [service_name]
+                if loaded.src == '.':
+                    services += ["custom_command", "env"]
 
                 # Put a index.html file into the root of the project folder and one in the src folder, depending on
                 # what src we are testing right now, we will expect a different file to be served.
                 index_file_in_dot = b'hello dot\n'
                 index_file_in_src = b'hello src\n'
 
-                with open(os.path.join(loaded.temp_dir, 'index.html'), 'wb') as f:
-                    f.write(index_file_in_dot)
+                _write_file(os.path.join(loaded.temp_dir, 'index.html'), index_file_in_dot)
                 os.makedirs(os.path.join(loaded.temp_dir, 'src'))
-                with open(os.path.join(loaded.temp_dir, 'src', 'index.html'), 'wb') as f:
-                    f.write(index_file_in_src)
+                _write_file(os.path.join(loaded.temp_dir, 'src', 'index.html'), index_file_in_src)
 
                 # START
-                self.run_start_test(loaded.engine, project, [service_name], loaded.engine_tester)
+                self.run_start_test(loaded.engine, project, services, loaded.engine_tester)
 
                 # Check response
                 if loaded.src == '.':
@@ -62,48 +72,31 @@ class EngineServiceTest(EngineTest):
                 self.assertTrue(bool(mode & stat.S_IWUSR), 'The src volume must be writable by owner')
                 self.assertTrue(write_check, 'The src volume must be ACTUALLY writable by owner')
 
-                # STOP
-                self.run_stop_test(loaded.engine, project, [service_name], loaded.engine_tester)
-
-    def test_custom_command(self):
-        for project_ctx in load(self,
-                                ['integration_all.yml'],
-                                ['.']):
-            with project_ctx as loaded:
-                project = loaded.config["project"]
-                service_name = "custom_command"
-
-                # START
-                self.run_start_test(loaded.engine, project, [service_name], loaded.engine_tester)
-
-                # Check response
-                # The custom command disables auto-index of http-server so we should get a directory
-                # listing instead
-                self.assert_response_matches_regex('<title>Index of /</title>', loaded.engine, project, service_name)
+                if "custom_command" in services:
+                    self._assert_custom_command(loaded)
+                if "env" in services:
+                    self._assert_environment(loaded)
 
                 # STOP
-                self.run_stop_test(loaded.engine, project, [service_name], loaded.engine_tester)
-
-    def test_environment(self):
-        for project_ctx in load(self,
-                                ['integration_all.yml'],
-                                ['.']):
-            with project_ctx as loaded:
-                engine = loaded.engine
-                project = loaded.config["project"]
-                service_name = "env"
-                service = loaded.config["project"]["app"]["services"][service_name]
+                self.run_stop_test(loaded.engine, project, services, loaded.engine_tester)
 
-                # START
-                self.run_start_test(loaded.engine, project, [service_name], loaded.engine_tester)
+    def _assert_custom_command(self, loaded):
+        """Assertions for the started service custom_command of integration_all.yml."""
+        # The custom command disables auto-index of http-server so we should get a directory
+        # listing instead
+        self.assert_response_matches_regex('<title>Index of /</title>', loaded.engine,
+                                           loaded.config["project"], "custom_command")
 
-                self.assertEqual('TEST_ENV_VALUE', loaded.engine_tester.get_env('TEST_ENV_KEY',
-                                                                                engine, project, service))
-                self.assertIsNone(loaded.engine_tester.get_env('TEST_ENV_DOES_NOT_EXIST',
-                                                               engine, project, service))
+    def _assert_environment(self, loaded):
+        """Assertions for the started service env of integration_all.yml."""
+        engine = loaded.engine
+        project = loaded.config["project"]
+        service = project["app"]["services"]["env"]
 
-                # STOP
-                self.run_stop_test(loaded.engine, project, [service_name], loaded.engine_tester)
+        self.assertEqual('TEST_ENV_VALUE', loaded.engine_tester.get_env('TEST_ENV_KEY',
+                                                                        engine, project, service))
+        self.assertIsNone(loaded.engine_tester.get_env('TEST_ENV_DOES_NOT_EXIST',
+                                                       engine, project, service))
 
     def test_configs(self):
         for project_ctx in load(self,
@@ -419,7 +412,7 @@ class EngineServiceTest(EngineTest):
                 self.run_start_test(loaded.engine, project, [service1], loaded.engine_tester)
 
                 # Check if localhost:9965 get's us the contents of the service
-                response = requests.get('http://127.0.0.1:9965/hostname')
+                response = self.http.get('http://127.0.0.1:9965/hostname')
                 self.assertEqual(200, response.status_code)
                 self.assertEqual(response.content, b'additional_ports\n')
 
@@ -434,10 +427,10 @@ class EngineServiceTest(EngineTest):
                 self.run_start_test(loaded.engine, project, [service1], loaded.engine_tester)
 
                 # Check both services on expected ports
-                response = requests.get('http://127.0.0.1:9965/hostname')
+                response = self.http.get('http://127.0.0.1:9965/hostname')
                 self.assertEqual(200, response.status_code)
                 self.assertEqual(response.content, b'additional_ports\n')
-                response = requests.get('http://127.0.0.1:9966/hostname')
+                response = self.http.get('http://127.0.0.1:9966/hostname')
                 self.assertEqual(200, response.status_code)
                 self.assertEqual(response.content, b'additional_ports_again\n',
                                  "The second service must register an additional port on host of 9965 + 1")
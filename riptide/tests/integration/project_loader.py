@@ -51,6 +51,11 @@ def load(testsuite,
 
     The context manager starts a sub test with the appropriate values
 
+    The context managers must be used one after another, in the order they are yielded, never concurrently
+    (eg. in threads): The temporary directories of a context manager are removed when the next one is created,
+    entering one changes the working directory and the mocked configuration directory of the whole process and
+    leaving one resets the engine, which removes the containers of all projects.
+
     USAGE:
         for project_ctx in load(...):
             with project_ctx as loaded:
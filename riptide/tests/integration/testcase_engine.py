@@ -3,11 +3,26 @@ import asyncio
 import unittest
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import re, Union, AnyStr, Pattern
 from urllib import request
+from urllib3.util.retry import Retry
 
 
 class EngineTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Re-use connections to the services for all requests of the test case
+        cls.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                              max_retries=Retry(total=3, backoff_factor=0.1))
+        cls.http.mount('http://', adapter)
+        cls.http.mount('https://', adapter)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.http.close()
+
     def run_start_test(self, engine, project, services, engine_tester):
         # Run async test code
         loop = asyncio.get_event_loop()
@@ -55,14 +70,14 @@ class EngineTest(unittest.TestCase):
 
     def assert_response(self, rsp_message: bytes, engine, project, service_name, sub_path="", msg=None):
         (ip, port) = engine.address_for(project, service_name)
-        response = requests.get('http://' + ip + ':' + port + sub_path)
+        response = self.http.get('http://' + ip + ':' + port + sub_path)
 
         self.assertEqual(200, response.status_code)
         self.assertEqual(rsp_message, response.content, msg)
 
     def assert_response_matches_regex(self, regex: Union[AnyStr, Pattern[AnyStr]], engine, project, service_name):
         (ip, port) = engine.address_for(project, service_name)
-        response = requests.get('http://' + ip + ':' + port)
+        response = self.http.get('http://' + ip + ':' + port)
 
         self.assertEqual(200, response.status_code)
         self.assertRegex(response.content.decode('utf-8'), regex)
@@ -0,0 +1,383 @@
+import asyncio
+import os
+import threading
+import shutil
+import time
+import unittest
+from tempfile import TemporaryDirectory
+from unittest import mock
+from unittest.mock import Mock
+
+from riptide.engine import abstract
+from riptide.engine.abstract import AbstractEngine, _fast_copyfile
+from riptide.engine.results import StartStopResultStep, ResultError
+
+
+class EngineStub(AbstractEngine):
+    """Engine without any engine specific functionality, only the concrete helpers of AbstractEngine."""
+    def _pull_image(self, image, update_func):
+        self.pulled.append(image)
+        if image == 'broken':
+            raise OSError('broken')
+        if image == 'not_found':
+            return 'Warning: Image not found in repository.'
+        update_func('Downloading...')
+        return 'Done.'
+
+    def __init__(self):
+        self.address_lookups = 0
+        self.container_lookups = 0
+        self.pulled = []
+
+    def _list_project_containers(self, project):
+        self.container_lookups += 1
+        if 'running' in project:
+            return {service_name: True for service_name in project['running']}
+        return {'web': True, 'db': False}
+
+    def _address_for_impl(self, project, service_name):
+        self.address_lookups += 1
+        return ('127.0.0.1', '8080') if service_name in project.get('running', []) else None
+
+    def _stop_one_service(self, project, service_name, result_queue):
+        project['running'].remove(service_name)
+        result_queue.end()
+        # The worker is still busy after the queue was ended
+        time.sleep(0.2)
+
+    def _service_dependencies(self, project, service_name):
+        return {'web': ['db']}.get(service_name, [])
+
+    def _start_one_service(self, project, service_name, result_queue, quick=False, command_group="default"):
+        if service_name == 'broken':
+            raise OSError('broken')
+        if project.get('db_fails') and service_name == 'db':
+            result_queue.end_with_error(ResultError('db failed'))
+            return
+        if 'pulled' in project:
+            # The image must always be pulled before starting
+            project['pulled'].append(self.pulled[:])
+        project['started'].append(service_name)
+        result_queue.put(StartStopResultStep(steps=1, current_step=1, text='Started'))
+        result_queue.end()
+
+
+EngineStub.__abstractmethods__ = frozenset()
+
+
+class AbstractEngineTestCase(unittest.TestCase):
+
+    def test_pull_images_parallel(self):
+        output = []
+        EngineStub()._pull_images_parallel(
+            [('service/one', 'image1'), ('service/two', 'not_found'), ('command/three', 'image3')],
+            output.append, line_reset='\r'
+        )
+        text = ''.join(output)
+        self.assertIn("[service/one] Pulling 'image1'...\n", text)
+        self.assertIn("[service/one] Done.\n", text)
+        self.assertIn("[service/two] Warning: Image not found in repository.\n", text)
+        self.assertIn("[command/three] Done.\n", text)
+        self.assertTrue(text.endswith('\n'))
+
+    def test_pull_images_parallel_error(self):
+        output = []
+        with self.assertRaises(OSError):
+            EngineStub()._pull_images_parallel(
+                [('service/one', 'image1'), ('service/two', 'broken')], output.append, line_reset='\r'
+            )
+        self.assertIn("[service/one] Done.\n", ''.join(output))
+
+    def test_pull_images_parallel_no_images(self):
+        output = []
+        EngineStub()._pull_images_parallel([], output.append)
+        self.assertEqual([], output)
+
+    def test_start_services_parallel(self):
+        project = {'name': 'project', 'started': []}
+
+        async def run():
+            results = {}
+            async for service_name, status, finished in EngineStub()._start_services_parallel(project, ['web', 'db']):
+                if finished:
+                    results[service_name] = status
+            return results
+
+        self.assertEqual({'web': None, 'db': None}, asyncio.run(run()))
+        self.assertEqual(['db', 'web'], project['started'])
+
+    def test_start_services_parallel_error(self):
+        async def run():
+            results = {}
+            async for service_name, status, finished in EngineStub()._start_services_parallel({'name': 'project'}, ['broken']):
+                if finished:
+                    results[service_name] = status
+            return results
+
+        self.assertIsInstance(asyncio.run(run())['broken'], ResultError)
+
+    def test_start_services_parallel_dependency_ended_with_error(self):
+        project = {'name': 'project', 'started': [], 'db_fails': True}
+
+        async def run():
+            results = {}
+            async for service_name, status, finished in EngineStub()._start_services_parallel(project, ['web', 'db']):
+                if finished:
+                    results[service_name] = status
+            return results
+
+        results = asyncio.run(run())
+        self.assertIsInstance(results['db'], ResultError)
+        self.assertIsInstance(results['web'], ResultError)
+        self.assertEqual([], project['started'])
+
+    def test_sort_by_dependencies(self):
+        self.assertEqual(['db', 'web', 'other'], EngineStub()._sort_by_dependencies(None, ['web', 'other', 'db']))
+        self.assertEqual(['web', 'other'], EngineStub()._sort_by_dependencies(None, ['web', 'other']))
+
+    def test_path_copy(self):
+        with TemporaryDirectory() as project_dir:
+            project = Mock(folder=Mock(return_value=project_dir))
+            src = os.path.join(project_dir, 'from')
+            os.makedirs(os.path.join(src, 'sub', 'subsub'))
+            with open(os.path.join(src, 'file'), 'w') as f:
+                f.write('one')
+            with open(os.path.join(src, 'sub', 'subsub', 'file'), 'w') as f:
+                f.write('two')
+            os.chmod(os.path.join(src, 'file'), 0o640)
+            os.utime(os.path.join(src, 'file'), (1000, 2000))
+
+            EngineStub().path_copy(src, os.path.join(project_dir, 'to'), project)
+
+            with open(os.path.join(project_dir, 'to', 'file')) as f:
+                self.assertEqual('one', f.read())
+            with open(os.path.join(project_dir, 'to', 'sub', 'subsub', 'file')) as f:
+                self.assertEqual('two', f.read())
+            copied_stat = os.stat(os.path.join(project_dir, 'to', 'file'))
+            self.assertEqual(0o640, copied_stat.st_mode & 0o777)
+            self.assertEqual(2000, copied_stat.st_mtime)
+
+    def test_path_copy_not_in_project(self):
+        with TemporaryDirectory() as project_dir, TemporaryDirectory() as other_dir:
+            project = Mock(folder=Mock(return_value=project_dir))
+            with self.assertRaises(PermissionError):
+                EngineStub().path_copy(project_dir, os.path.join(other_dir, 'to'), project)
+
+    def test_path_copy_file(self):
+        with TemporaryDirectory() as project_dir:
+            project = Mock(folder=Mock(return_value=project_dir))
+            src = os.path.join(project_dir, 'from')
+            with open(src, 'wb') as f:
+                f.write(b'content' * 100000)
+            # Make sure an existing, longer target is truncated
+            with open(os.path.join(project_dir, 'to'), 'wb') as f:
+                f.write(b'x' * 1000000)
+
+            EngineStub().path_copy(src, os.path.join(project_dir, 'to'), project)
+
+            with open(os.path.join(project_dir, 'to'), 'rb') as f:
+                self.assertEqual(b'content' * 100000, f.read())
+
+    def test_fast_copyfile_same_file(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'file')
+            with open(path, 'w') as f:
+                f.write('content')
+            with self.assertRaises(shutil.SameFileError):
+                _fast_copyfile(path, path)
+            with open(path) as f:
+                self.assertEqual('content', f.read())
+
+    def test_path_rm(self):
+        with TemporaryDirectory() as project_dir:
+            project = Mock(folder=Mock(return_value=project_dir))
+            os.makedirs(os.path.join(project_dir, 'dir', 'sub'))
+            with open(os.path.join(project_dir, 'dir', 'sub', 'file'), 'w') as f:
+                f.write('content')
+            os.symlink(os.path.join(project_dir, 'dir'), os.path.join(project_dir, 'link'))
+
+            EngineStub().path_rm(os.path.join(project_dir, 'link'), project)
+            self.assertFalse(os.path.lexists(os.path.join(project_dir, 'link')))
+            self.assertTrue(os.path.exists(os.path.join(project_dir, 'dir', 'sub', 'file')))
+
+            EngineStub().path_rm(os.path.join(project_dir, 'dir', 'sub', 'file'), project)
+            self.assertFalse(os.path.exists(os.path.join(project_dir, 'dir', 'sub', 'file')))
+
+            EngineStub().path_rm(os.path.join(project_dir, 'dir'), project)
+            self.assertFalse(os.path.exists(os.path.join(project_dir, 'dir')))
+
+            # Doesn't exist (anymore)
+            EngineStub().path_rm(os.path.join(project_dir, 'dir'), project)
+
+    def test_path_rm_not_in_project(self):
+        with TemporaryDirectory() as project_dir, TemporaryDirectory() as other_dir:
+            project = Mock(folder=Mock(return_value=project_dir))
+            with self.assertRaises(PermissionError):
+                EngineStub().path_rm(other_dir, project)
+            with self.assertRaises(PermissionError):
+                EngineStub().path_rm(os.path.join(project_dir, '..', os.path.basename(other_dir)), project)
+            with self.assertRaises(PermissionError):
+                EngineStub().path_rm(project_dir, project)
+            self.assertTrue(os.path.exists(other_dir))
+            self.assertTrue(os.path.exists(project_dir))
+
+    def test_address_for_cached(self):
+        engine = EngineStub()
+        project = {'name': 'project', 'running': ['web']}
+        self.assertEqual(('127.0.0.1', '8080'), engine.address_for(project, 'web'))
+        self.assertEqual(('127.0.0.1', '8080'), engine.address_for(project, 'web'))
+        self.assertIsNone(engine.address_for(project, 'db'))
+        self.assertIsNone(engine.address_for(project, 'db'))
+        self.assertEqual(2, engine.address_lookups)
+
+        project['running'].append('db')
+        engine._invalidate_service_cache(project, 'db')
+        self.assertEqual(('127.0.0.1', '8080'), engine.address_for(project, 'db'))
+        self.assertEqual(3, engine.address_lookups)
+
+    def test_address_for_after_stop(self):
+        engine = EngineStub()
+        project = {'name': 'project', 'running': ['web']}
+        self.assertEqual(('127.0.0.1', '8080'), engine.address_for(project, 'web'))
+
+        async def run():
+            async for _ in engine._stop_services_parallel(project, ['web']):
+                pass
+            return engine.address_for(project, 'web')
+
+        self.assertIsNone(asyncio.run(run()))
+
+    def test_status_after_stop(self):
+        engine = EngineStub()
+        project = {'name': 'project', 'running': ['web'], 'app': {'services': {'web': {}}}}
+        self.assertEqual({'web': True}, engine.status(project))
+
+        async def run():
+            async for _ in engine._stop_services_parallel(project, ['web']):
+                pass
+            return engine.status(project), engine.service_status(project, 'web')
+
+        self.assertEqual(({'web': False}, False), asyncio.run(run()))
+
+    def test_status(self):
+        engine = EngineStub()
+        project = {'name': 'project', 'app': {'services': {'web': {}, 'db': {}, 'other': {}}}}
+        self.assertEqual({'web': True, 'db': False, 'other': False}, engine.status(project))
+        self.assertTrue(engine.service_status(project, 'web'))
+        self.assertFalse(engine.service_status(project, 'db'))
+        self.assertFalse(engine.service_status(project, 'other'))
+        self.assertEqual(1, engine.container_lookups)
+
+        engine._invalidate_service_cache(project, 'web')
+        self.assertTrue(engine.service_status(project, 'web'))
+        self.assertEqual(2, engine.container_lookups)
+
+    def test_pull_and_start_services_parallel(self):
+        engine = EngineStub()
+        project = {'name': 'project', 'started': [], 'pulled': [], 'app': {'services': {
+            'web': {'image': 'image1'}, 'db': {'image': 'broken'}, 'other': {'image': 'image1'}
+        }}}
+
+        async def run():
+            results = {}
+            async for service_name, status, finished in engine._pull_and_start_services_parallel(project, ['web', 'db', 'other']):
+                if finished:
+                    results[service_name] = status
+            return results
+
+        self.assertEqual({'web': None, 'db': None, 'other': None}, asyncio.run(run()))
+        self.assertEqual(['image1', 'broken'], sorted(engine.pulled, reverse=True))
+        self.assertEqual(['db', 'other', 'web'], sorted(project['started']))
+        self.assertLess(project['started'].index('db'), project['started'].index('web'))
+        for service_name, pulled_before_start in zip(project['started'], project['pulled']):
+            self.assertIn(project['app']['services'][service_name]['image'], pulled_before_start)
+
+    def test_await_state(self):
+        engine = EngineStub()
+        project = {'name': 'project'}
+        self.assertTrue(engine.await_state(project, 'web', True, 1))
+        self.assertTrue(engine.await_state(project, 'db', False, 1))
+        self.assertFalse(engine.await_state(project, 'db', True, 0.3))
+
+    @unittest.skipUnless(hasattr(os, 'copy_file_range'), "copy_file_range not available")
+    def test_fast_copyfile_copy_file_range_copies_nothing(self):
+        with TemporaryDirectory() as directory:
+            src = os.path.join(directory, 'from')
+            dst = os.path.join(directory, 'to')
+            with open(src, 'w') as f:
+                f.write('content')
+            with mock.patch('os.copy_file_range', return_value=0):
+                _fast_copyfile(src, dst)
+            with open(dst) as f:
+                self.assertEqual('content', f.read())
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), "named pipes not available")
+    def test_fast_copyfile_named_pipe(self):
+        with TemporaryDirectory() as directory:
+            fifo = os.path.join(directory, 'fifo')
+            file = os.path.join(directory, 'file')
+            os.mkfifo(fifo)
+            with open(file, 'w') as f:
+                f.write('content')
+            with self.assertRaises(shutil.SpecialFileError):
+                _fast_copyfile(fifo, os.path.join(directory, 'to'))
+            with self.assertRaises(shutil.SpecialFileError):
+                _fast_copyfile(file, fifo)
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), "named pipes not available")
+    def test_path_copy_named_pipe(self):
+        with TemporaryDirectory() as project_dir:
+            project = Mock(folder=Mock(return_value=project_dir))
+            os.makedirs(os.path.join(project_dir, 'from'))
+            os.mkfifo(os.path.join(project_dir, 'from', 'fifo'))
+            with open(os.path.join(project_dir, 'from', 'file'), 'w') as f:
+                f.write('content')
+            with self.assertRaises(shutil.Error) as cm:
+                EngineStub().path_copy(os.path.join(project_dir, 'from'), os.path.join(project_dir, 'to'), project)
+            self.assertEqual([os.path.join(project_dir, 'from', 'fifo')], [error[0] for error in cm.exception.args[0]])
+            # The other files are still copied
+            with open(os.path.join(project_dir, 'to', 'file')) as f:
+                self.assertEqual('content', f.read())
+
+    @unittest.skipUnless(hasattr(os, 'setxattr'), "extended attributes not available")
+    def test_path_copy_xattrs(self):
+        with TemporaryDirectory() as project_dir:
+            project = Mock(folder=Mock(return_value=project_dir))
+            src = os.path.join(project_dir, 'from')
+            os.makedirs(src)
+            with open(os.path.join(src, 'file'), 'w') as f:
+                f.write('content')
+            try:
+                os.setxattr(os.path.join(src, 'file'), 'user.test', b'value')
+                os.setxattr(src, 'user.test', b'dir_value')
+            except OSError:
+                self.skipTest("File system doesn't support extended attributes")
+
+            EngineStub().path_copy(src, os.path.join(project_dir, 'to'), project)
+
+            self.assertEqual(b'value', os.getxattr(os.path.join(project_dir, 'to', 'file'), 'user.test'))
+            self.assertEqual(b'dir_value', os.getxattr(os.path.join(project_dir, 'to'), 'user.test'))
+
+    def test_path_copy_concurrently(self):
+        copying_threads = set()
+        fast_copyfile = abstract._fast_copyfile
+
+        def record_thread(src, dst):
+            copying_threads.add(threading.current_thread())
+            fast_copyfile(src, dst)
+
+        with TemporaryDirectory() as project_dir:
+            project = Mock(folder=Mock(return_value=project_dir))
+            src = os.path.join(project_dir, 'from')
+            for i in range(20):
+                os.makedirs(os.path.join(src, str(i % 3)), exist_ok=True)
+                with open(os.path.join(src, str(i % 3), str(i)), 'w') as f:
+                    f.write(str(i))
+
+            with mock.patch('riptide.engine.abstract._fast_copyfile', side_effect=record_thread):
+                EngineStub().path_copy(src, os.path.join(project_dir, 'to'), project)
+
+            for i in range(20):
+                with open(os.path.join(project_dir, 'to', str(i % 3), str(i))) as f:
+                    self.assertEqual(str(i), f.read())
+            self.assertNotIn(threading.current_thread(), copying_threads)
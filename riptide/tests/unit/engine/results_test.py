@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import unittest
+
+from riptide.engine.results import ResultQueue, MultiResultQueue, ResultError, EndResultQueue
+
+
+class ResultsTestCase(unittest.TestCase):
+
+    def test_multi_result_queue(self):
+        count = 1000
+
+        def produce(queue, fail):
+            for i in range(count):
+                queue.put(i)
+            if fail:
+                queue.end_with_error(ResultError('failed'))
+            else:
+                queue.end()
+
+        async def run():
+            queues = {ResultQueue(): 'one', ResultQueue(): 'two', ResultQueue(): 'three'}
+            for queue, name in queues.items():
+                threading.Thread(target=produce, args=(queue, name == 'three')).start()
+            values = {name: [] for name in queues.values()}
+            ends = {}
+            async for name, value, finished in MultiResultQueue(queues):
+                if finished:
+                    ends[name] = value
+                else:
+                    values[name].append(value)
+            return values, ends
+
+        values, ends = asyncio.run(run())
+        self.assertEqual({'one': list(range(count)), 'two': list(range(count)), 'three': list(range(count))}, values)
+        self.assertIsNone(ends['one'])
+        self.assertIsNone(ends['two'])
+        self.assertIsInstance(ends['three'], ResultError)
+
+    def test_result_queue_get_after_end(self):
+        async def run():
+            queue = ResultQueue()
+            queue.put('value')
+            queue.end()
+            self.assertEqual(['value'], [value async for value in queue])
+            with self.assertRaises(EOFError):
+                await queue.get()
+
+        asyncio.run(run())
+
+    def test_result_queue_put_after_reader_loop_closed(self):
+        queue = ResultQueue()
+
+        async def run():
+            task = asyncio.ensure_future(queue.get())
+            await asyncio.sleep(0)
+            # The reader is waiting, but its loop is closed before it is woken up.
+            return task
+
+        loop = asyncio.new_event_loop()
+        task = loop.run_until_complete(run())
+        waiter = queue._waiter
+        task.cancel()
+        loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        loop.close()
+        # Simulate the writer still holding the waiter of the closed loop
+        queue._waiter = waiter
+
+        queue.put('value')
+        queue.end()
+        self.assertTrue(queue.was_ended_put)
+        self.assertEqual(['value'], [item for item in queue.queue if not isinstance(item, EndResultQueue)])